@@ -0,0 +1,78 @@
+"""Benchmark list/search serialization in rows/sec (no database needed).
+
+Compares the response_model path (per-row ItemResponse validation from
+ORM-like objects, jsonable_encoder, json.dumps) with encoding plain row
+dicts via FastJSONResponse, with and without orjson:
+
+    python benchmarks/bench_serialization.py --rows 1000 --repeat 200
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+import main  # noqa: E402
+from main import FastJSONResponse, ItemResponse  # noqa: E402
+
+def make_rows(count: int) -> List[dict]:
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "id": i,
+            "name": f"item {i}",
+            "description": f"description of item {i} " * 4,
+            "created_at": start + timedelta(seconds=i),
+        }
+        for i in range(count)
+    ]
+
+def bench(label: str, fn, rows: int, repeat: int):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {rows * repeat / elapsed:>14,.0f} rows/sec")
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    orm_like = [SimpleNamespace(**row) for row in rows]
+    adapter = TypeAdapter(List[ItemResponse])
+
+    def response_model_path():
+        validated = adapter.validate_python(orm_like, from_attributes=True)
+        JSONResponse(jsonable_encoder(validated)).body
+
+    def fast_path_json():
+        orjson, main.orjson = main.orjson, None
+        try:
+            FastJSONResponse(rows).body
+        finally:
+            main.orjson = orjson
+
+    def fast_path_orjson():
+        FastJSONResponse(rows).body
+
+    bench("response_model + JSONResponse", response_model_path, args.rows, args.repeat)
+    bench("row dicts + json", fast_path_json, args.rows, args.repeat)
+    if main.orjson is not None:
+        bench("row dicts + orjson", fast_path_orjson, args.rows, args.repeat)
+    else:
+        print("orjson not installed: skipping the orjson path")
+
+if __name__ == "__main__":
+    main_()
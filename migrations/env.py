@@ -0,0 +1,45 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+from sqlalchemy.engine import make_url
+
+from main import Base, DATABASE_URL
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def sync_database_url(url: str):
+    """Migrations run synchronously, so use psycopg2 whatever driver the app uses"""
+    db_url = make_url(url)
+    if db_url.drivername.startswith("postgres"):
+        db_url = db_url.set(drivername="postgresql+psycopg2")
+    return db_url
+
+def run_migrations_offline():
+    """Emit SQL to stdout instead of running against a database"""
+    context.configure(
+        url=sync_database_url(DATABASE_URL).render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    """Run migrations against DATABASE_URL"""
+    connectable = create_engine(sync_database_url(DATABASE_URL), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,48 @@
+"""Initial schema: items and users
+
+Databases created before migrations existed already have these tables
+(from Base.metadata.create_all), so only missing tables are created.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "items" not in existing:
+        op.create_table(
+            "items",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String()),
+            sa.Column("description", sa.String()),
+            sa.Column("created_at", sa.DateTime()),
+        )
+        op.create_index("ix_items_id", "items", ["id"])
+        op.create_index("ix_items_name", "items", ["name"])
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("username", sa.String()),
+            sa.Column("email", sa.String()),
+            sa.Column("created_at", sa.DateTime()),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+
+def downgrade():
+    op.drop_table("users")
+    op.drop_table("items")
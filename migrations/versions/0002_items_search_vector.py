@@ -0,0 +1,43 @@
+"""Stored tsvector column with GIN index on items, plus (created_at, id) index
+
+search_vector is a generated column so Postgres keeps it in sync with
+name/description; adding it rewrites the table once. Indexes are built
+CONCURRENTLY so the table stays writable while they are created.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_SQL = "to_tsvector('english', name || ' ' || COALESCE(description, ''))"
+
+
+def upgrade():
+    op.add_column(
+        "items",
+        sa.Column("search_vector", TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True)),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_search_vector", "items", ["search_vector"],
+            postgresql_using="gin", postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_items_created_at_id", "items", ["created_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_items_created_at_id", table_name="items", postgresql_concurrently=True)
+        op.drop_index("ix_items_search_vector", table_name="items", postgresql_concurrently=True)
+    op.drop_column("items", "search_vector")
@@ -0,0 +1,24 @@
+"""Server-side default for items.created_at
+
+created_at used to be filled in by the application (datetime.utcnow);
+the database now sets it so inserts can return it via RETURNING.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column("items", "created_at", server_default=sa.text("(now() AT TIME ZONE 'utc')"))
+
+
+def downgrade():
+    op.alter_column("items", "created_at", server_default=None)
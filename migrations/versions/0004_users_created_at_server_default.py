@@ -0,0 +1,24 @@
+"""Server-side default for users.created_at
+
+Lets user inserts (including INSERT ... ON CONFLICT) return created_at via
+RETURNING instead of having the application fill it in.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column("users", "created_at", server_default=sa.text("(now() AT TIME ZONE 'utc')"))
+
+
+def downgrade():
+    op.alter_column("users", "created_at", server_default=None)
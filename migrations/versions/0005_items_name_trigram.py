@@ -0,0 +1,38 @@
+"""pg_trgm and prefix indexes on items.name for autocomplete and fuzzy search
+
+The prefix index is on lower(name) in C collation. Autocomplete bounds it
+explicitly (lower(name) >= lower(prefix) AND < lower(prefix) || U+10FFFF),
+which gives an index range scan even from a generic prepared plan, already
+in ORDER BY order (top-k without a sort).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_name_trgm", "items", ["name"],
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_items_name_lower_prefix", "items", [sa.text('(lower(name) COLLATE "C")'), "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_items_name_lower_prefix", table_name="items", postgresql_concurrently=True)
+        op.drop_index("ix_items_name_trgm", table_name="items", postgresql_concurrently=True)
@@ -0,0 +1,37 @@
+"""Shared fixtures.
+
+Tests using `client` need a PostgreSQL database migrated with `alembic upgrade
+head`, reached via DATABASE_URL; they are skipped when it is not reachable.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client for a running database; skips the test without one"""
+    with TestClient(main.app) as client:
+        if client.get("/health").status_code != 200:
+            pytest.skip("database not reachable (set DATABASE_URL)")
+        yield client
+
+
+@pytest.fixture
+def app_client():
+    """Client that turns unhandled errors into 500 responses; no database needed"""
+    with TestClient(main.app, raise_server_exceptions=False) as client:
+        yield client
+
+
+@pytest.fixture
+def failing_route():
+    """Path of a temporary route whose handler raises, removed after the test"""
+    async def fail():
+        raise RuntimeError("boom")
+
+    main.app.add_api_route("/_test/fail", fail)
+    route = main.app.router.routes[-1]
+    yield route.path
+    main.app.router.routes.remove(route)
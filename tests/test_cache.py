@@ -0,0 +1,65 @@
+"""RedisCache against fakeredis (no Redis server needed)"""
+import asyncio
+
+import fakeredis.aioredis
+import pytest
+
+import main
+
+
+class BrokenRedis:
+    """Client whose every command fails, like a Redis server that went away"""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise ConnectionError("redis is down")
+        return fail
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.aioredis.FakeRedis()
+
+
+def test_get_many_returns_values_in_key_order(redis_client):
+    cache = main.RedisCache(redis_client, "test", ttl=60)
+
+    async def scenario():
+        await cache.set(1, {"id": 1})
+        await cache.set(3, {"id": 3})
+        return await cache.get_many([3, 2, 1]), await cache.get_many([])
+
+    assert asyncio.run(scenario()) == ([{"id": 3}, None, {"id": 1}], [])
+    assert (cache.hits, cache.misses, cache.errors) == (2, 1, 0)
+
+
+def test_workers_share_the_generation(redis_client):
+    worker_a = main.RedisCache(redis_client, "test", ttl=60)
+    worker_b = main.RedisCache(redis_client, "test", ttl=60)
+
+    async def scenario():
+        before = await worker_b.generation()
+        await worker_a.bump_generation()
+        await worker_a.set("key", "shared")
+        return before, await worker_b.generation(), await worker_b.get("key")
+
+    assert asyncio.run(scenario()) == (0, 1, "shared")
+
+
+def test_redis_errors_become_misses():
+    cache = main.RedisCache(BrokenRedis(), "test", ttl=60)
+
+    async def scenario():
+        await cache.set("key", "value")
+        await cache.delete("key")
+        await cache.bump_generation()
+        return (
+            await cache.get("key"),
+            await cache.get_many(["a", "b"]),
+            await cache.generation(),
+            await cache.ping(),
+        )
+
+    assert asyncio.run(scenario()) == (None, [None, None], -1, False)
+    assert cache.misses == 3
+    assert cache.errors == 7
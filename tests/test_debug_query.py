@@ -0,0 +1,35 @@
+"""Smoke tests for /debug/query (ENVIRONMENT=development)"""
+import json
+
+import pytest
+
+import main
+
+
+def query_lines(client, query, **params):
+    response = client.get("/debug/query", params=dict(params, query=query))
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_debug_query_encodes_numeric_interval_uuid_and_bytea(client, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(main, "orjson", None)
+
+    row, meta = query_lines(
+        client,
+        "SELECT 1.5::numeric AS n, interval '90 seconds' AS i, "
+        "'a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11'::uuid AS u, '\\xff00'::bytea AS b",
+    )
+
+    assert row == {"n": "1.5", "i": 90.0, "u": "a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11", "b": "ff00"}
+    assert meta == {"_meta": {"rows": 1, "truncated": False, "error": None}}
+
+
+def test_debug_query_counts_only_rows_sent(client):
+    # asyncpg returns point as its own Point type, which has no JSON encoding
+    (meta,) = query_lines(client, "SELECT point(1, 2) AS p")
+
+    assert meta["_meta"]["rows"] == 0
+    assert "not JSON serializable" in meta["_meta"]["error"]
@@ -0,0 +1,104 @@
+"""Smoke tests for the item endpoints"""
+import json
+import uuid
+
+import pytest
+
+import main
+
+
+def test_export_accepts_timezone_aware_filters(client):
+    created = client.post("/items/", json={"name": "export me"}).json()
+
+    response = client.get("/items/export", params={"created_after": created["created_at"] + "Z"})
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert created["id"] in [row["id"] for row in rows]
+
+
+@pytest.mark.parametrize("params", [
+    {"after": "", "limit": 0},
+    {"limit": -1},
+    {"limit": main.LIST_MAX_LIMIT + 1},
+    {"skip": -1},
+])
+def test_list_rejects_out_of_range_paging(client, params):
+    assert client.get("/items/", params=params).status_code == 422
+
+
+def test_csv_import_accepts_utf8_bom(client):
+    body = "\ufeffname,description\r\nbom item,from excel\r\n".encode("utf-8")
+
+    response = client.post("/items/import?dry_run=true", content=body, headers={"content-type": "text/csv"})
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["valid"] == 1 and report["rejected"] == 0
+
+
+def test_csv_import_aborts_on_an_unreadable_header(client):
+    body = "n\xe4me,description\nfine,row\n".encode("latin-1")
+
+    report = client.post(
+        "/items/import?dry_run=true&on_error=skip", content=body, headers={"content-type": "text/csv"}
+    ).json()
+
+    assert report["aborted"] is True
+    assert report["valid"] == 0
+    assert report["errors"][0]["line"] == 1
+    assert report["errors"][0]["error"].startswith("Unreadable CSV header")
+
+
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_items_without_slash_redirects_to_the_list(client, method):
+    response = client.request(method, "/items", params={"limit": 2}, follow_redirects=False)
+
+    assert response.status_code == 307
+    assert response.headers["location"].endswith("/items/?limit=2")
+
+
+def test_batch_returns_items_in_request_order(client):
+    created = client.post("/items/", json={"name": "batch me"}).json()
+
+    response = client.get("/items/batch", params={"ids": f"{created['id']},0,{created['id']}"})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item and item["id"] for item in items] == [created["id"], None, created["id"]]
+
+
+def test_autocomplete_matches_prefix_literally(client):
+    tag = "ac" + uuid.uuid4().hex[:8]
+    for name in [f"{tag}%_ one", f"{tag}%_ two", f"{tag}x three", f"{tag[:-1]} other"]:
+        client.post("/items/", json={"name": name})
+
+    response = client.get("/items/autocomplete", params={"prefix": f"{tag.upper()}%_", "limit": 5})
+
+    assert response.status_code == 200
+    prefix_hits = [row["name"] for row in response.json()["results"] if row["match"] == "prefix"]
+    assert prefix_hits == [f"{tag}%_ one", f"{tag}%_ two"]
+
+
+def test_autocomplete_folds_case_like_the_index(client):
+    # Python lowers "İ" to "i" plus a combining dot; PostgreSQL lowers it to a plain "i"
+    tag = "ac" + uuid.uuid4().hex[:8]
+    client.post("/items/", json={"name": f"{tag}İstanbul"})
+
+    response = client.get("/items/autocomplete", params={"prefix": f"{tag}İst"})
+
+    assert [row["name"] for row in response.json()["results"]] == [f"{tag}İstanbul"]
+
+
+def test_get_item_rejects_ids_beyond_int4(client):
+    assert client.get(f"/items/{main.MAX_ID + 1}").status_code == 422
+    assert client.get(f"/items/{main.MAX_ID}").status_code == 404
+
+
+def test_batch_treats_ids_beyond_int4_as_missing(client):
+    created = client.post("/items/", json={"name": "batch big"}).json()
+
+    response = client.get("/items/batch", params={"ids": f"{created['id']},{main.MAX_ID + 1}"})
+
+    assert response.status_code == 200
+    assert response.json()["missing"] == [main.MAX_ID + 1]
@@ -0,0 +1,53 @@
+"""Request metrics for requests that fail; no database needed"""
+import pytest
+
+import main
+
+
+def test_unhandled_error_is_recorded_as_500(app_client, failing_route, caplog):
+    if main.prometheus_client is None:
+        pytest.skip("prometheus_client not installed")
+    labels = {"method": "GET", "route": failing_route, "status": "500"}
+    before = main.prometheus_client.REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+    with caplog.at_level("INFO", logger="main"):
+        assert app_client.get(failing_route).status_code == 500
+
+    assert main.prometheus_client.REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) == before + 1
+    assert any('"status": 500' in record.getMessage() for record in caplog.records)
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """Finished spans of a tracer swapped in for main.tracer"""
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(main, "tracer", provider.get_tracer(__name__))
+    return exporter
+
+
+def test_unhandled_error_ends_server_span_with_error(app_client, failing_route, exporter):
+    assert app_client.get(failing_route).status_code == 500
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == f"GET {failing_route}"
+    assert span.status.status_code == main.trace.StatusCode.ERROR
+    assert [event.name for event in span.events] == ["exception"]
+
+
+def test_response_validation_gets_its_own_span(app_client, exporter):
+    # Fails if FastAPI stops looking up fastapi.routing.serialize_response per request
+    assert app_client.get("/metrics/pool").status_code == 200
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    validate, server = spans["validate response_model"], spans["GET /metrics/pool"]
+    assert validate.parent.span_id == server.context.span_id
+
+
+def test_pool_metrics_never_report_negative_overflow(app_client):
+    assert app_client.get("/metrics/pool").json()["overflow"] >= 0
@@ -0,0 +1,93 @@
+"""Smoke tests for /items/search"""
+import asyncio
+import uuid
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def word():
+    """A term no other row matches, so results (and cache keys) are test-local"""
+    return "zq" + uuid.uuid4().hex[:10]
+
+
+def test_search_finds_new_item(client, word):
+    created = client.post("/items/", json={"name": f"{word} boots", "description": "waterproof"}).json()
+
+    response = client.get(f"/items/search/{word}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == word
+    assert [item["id"] for item in body["results"]] == [created["id"]]
+    assert body["results"][0]["relevance_score"] > 0
+    assert body["next_cursor"] is None
+
+
+def test_search_sees_writes_after_a_cached_miss(client, word):
+    assert client.get(f"/items/search/{word}").json()["results"] == []
+
+    client.post("/items/", json={"name": word})
+
+    assert len(client.get(f"/items/search/{word}").json()["results"]) == 1
+
+
+def test_search_pages_with_cursor(client, word):
+    for i in range(3):
+        client.post("/items/", json={"name": f"{word} {i}"})
+
+    first = client.get(f"/items/search/{word}?limit=2").json()
+    second = client.get(f"/items/search/{word}", params={"limit": 2, "after": first["next_cursor"]}).json()
+
+    ids = [item["id"] for item in first["results"] + second["results"]]
+    assert len(ids) == len(set(ids)) == 3
+    assert second["next_cursor"] is None
+
+
+def test_search_flight_started_before_a_write_is_not_cached_as_current(monkeypatch):
+    monkeypatch.setattr(main, "search_cache", main.MemoryCache("search", 16, 60))
+
+    async def scenario():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def before_write():
+            started.set()
+            await release.wait()
+            return ["stale"]
+
+        async def after_write():
+            return ["fresh"]
+
+        key = "test"
+        first = asyncio.ensure_future(main.cached_search(key, before_write))
+        await started.wait()
+        await main.invalidate_items([])
+        second = asyncio.ensure_future(main.cached_search(key, after_write))
+        release.set()
+        return await first, await second, await main.cached_search(key, after_write)
+
+    assert asyncio.run(scenario()) == (["stale"], ["fresh"], ["fresh"])
+
+
+def test_search_accepts_timezone_aware_filters(client, word):
+    client.post("/items/", json={"name": word})
+
+    response = client.get(
+        f"/items/search/{word}",
+        params={"created_after": "2000-01-01T00:00:00Z", "created_before": "2999-01-01T00:00:00+02:00"},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 1
+
+
+def test_highlight_snippets_escape_item_markup(client, word):
+    client.post("/items/", json={"name": f"{word} <img src=x onerror=alert(1)>", "description": "a & b <b>c</b>"})
+
+    (result,) = client.get(f"/items/search/{word}", params={"highlight": "true"}).json()["results"]
+
+    snippet = result["snippet"]
+    assert snippet.startswith(f"<b>{word}</b> &lt;img")
+    assert "<" not in snippet.replace("<b>", "").replace("</b>", "")
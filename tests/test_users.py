@@ -0,0 +1,24 @@
+"""Smoke tests for the user endpoints"""
+import uuid
+
+import main
+
+
+def test_get_user_rejects_ids_beyond_int4(client):
+    assert client.get(f"/users/{main.MAX_ID + 1}").status_code == 422
+    assert client.get(f"/users/{main.MAX_ID}").status_code == 404
+
+
+def test_bulk_upsert_counts_superseded_rows_apart_from_unchanged(client):
+    name = "u" + uuid.uuid4().hex[:12]
+    rows = [
+        {"username": name, "email": f"{name}-old@example.com"},
+        {"username": name, "email": f"{name}@example.com"},
+    ]
+
+    first = client.post("/users/bulk-upsert", json=rows).json()
+    again = client.post("/users/bulk-upsert", json=rows[1:]).json()
+
+    assert (first["inserted"], first["unchanged"], first["superseded"]) == (1, 0, 1)
+    assert (again["inserted"], again["unchanged"], again["superseded"]) == (0, 1, 0)
+    assert client.get(f"/users/by-username/{name}").json()["email"] == f"{name}@example.com"